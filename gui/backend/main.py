@@ -1,16 +1,31 @@
-from numpy import eye
+from numpy import around, column_stack, eye
+import asyncio
+import os
+import pickle
 import re
+import tempfile
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from hashlib import blake2b
+from multiprocessing import Pool
+from pathlib import Path
 from typing import Set
 
 from promis import ProMis, StaRMap
 from promis.geo import PolarLocation, CartesianLocation, CartesianRasterBand, CartesianMap
 from promis.loaders import OsmLoader
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, ValidationError
 from .models.Config import Config
 
+# Matches spatial relations in a logic program, capturing only the location type
+_SPATIAL_RE = re.compile(r"(?:distance|over)\(\s*[A-Z],\s*(?:[A-Z],\s*)?(\w*)\)")
+
 class Item(BaseModel):
     source: str
     origin: tuple[float, float]
@@ -19,7 +34,41 @@ class Item(BaseModel):
     location_types: dict[str, str]
 
 
-app = FastAPI()
+class ORJSONRequest(Request):
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+class ORJSONRoute(APIRoute):
+    # Parses request bodies with orjson before they are validated by Pydantic
+    def get_route_handler(self):
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request):
+            return await route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
+# Workers are kept alive across requests to avoid spawning a pool per call,
+# solving falls back to a temporary pool while none is running
+pool = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global pool
+    pool = Pool(4)
+    try:
+        yield
+    finally:
+        pool.close()
+        pool.join()
+        pool = None
+
+
+app = FastAPI(lifespan=lifespan)
+app.router.route_class = ORJSONRoute
 
 origins = [
     "http://localhost:3000",
@@ -33,116 +82,209 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def find_necessary_type(source: str) -> Set[str]:
-    spatial_relation = r"(distance|over)"
-
-    p = re.compile(spatial_relation +  r"(\(\s*[A-Z],\s*[A-Z],\s*)([\w]*)(\))")
-
-    maches = p.findall(source)
-    location_types = [match[2] for match in maches]
-    return set(location_types)
-
-def myHash(text:str):
-  hash=0
-  for ch in text:
-    hash = ( hash*281  ^ ord(ch)*997) & 0xFFFFFFFF
-  return hash
+CONFIG_PATH = './config/config.json'
 
-@app.post("/runpromis")
-def run_new(req: Item):
-    # We center a 1km^2 mission landscape over TU Darmstadt
-    mission_center = PolarLocation(latitude=req.origin[0], longitude=req.origin[1])
-    dimensions = req.dimensions
-    width, height = dimensions
+# The most recently used StaR Maps by environment, i.e.,
+# origin, dimensions, location types, resolutions and samples
+STAR_MAP_CACHE_SIZE = 4
+star_map_cache: OrderedDict[tuple, StaRMap] = OrderedDict()
 
-    # We load geographic features from OpenStreetMap using a range of filters
-    location_types = req.location_types
+def find_necessary_type(source: str) -> Set[str]:
+    return set(_SPATIAL_RE.findall(source))
 
-    # prepare for hash
-    reqDict = req.model_dump()
-    del reqDict["source"]
-    del reqDict["resolutions"]
+def myHash(data: bytes):
+  return int.from_bytes(blake2b(data, digest_size=8).digest(), "big")
 
-    hashVal = myHash(repr(reqDict))
+@lru_cache(maxsize=32)
+def build_uam(
+    origin: tuple[float, float],
+    dimensions: tuple[int, int],
+    location_types: tuple[tuple[str, str], ...]
+) -> CartesianMap:
+    # prepare for hash from the fixed set of fields that define the map
+    hashVal = myHash(pickle.dumps((origin, dimensions, location_types), protocol=5))
     # load the cache info
     try:
-        with open(f"./cache/uam_{hashVal}.pickle", 'rb') as f:
-            uam = CartesianMap.load(f"./cache/uam_{hashVal}.pickle")
-            has_cache = True
-            print("found cache")
+        uam = CartesianMap.load(f"./cache/uam_{hashVal}.pickle")
+        print("found cache")
+        return uam
     except FileNotFoundError:
-        has_cache = False
+        pass
+
+    mission_center = PolarLocation(latitude=origin[0], longitude=origin[1])
+    osm_loader = OsmLoader(mission_center, dimensions, dict(location_types))
+
+    # We now convert the data into an Uncertainty Annotated Map
+    uam = osm_loader.to_cartesian_map()
 
-    if (not has_cache):
-        osm_loader = OsmLoader(mission_center, dimensions)
-        for name, osm_filter in location_types.items():
-            osm_loader.load_routes(osm_filter, name)
-            osm_loader.load_polygons(osm_filter, name)
+    # We can add extra information, e.g., from background knowledge or other sensors
+    # Here, we place the drone operator at the center of the map
+    uam.features.append(CartesianLocation(0, 0, location_type="operator"))
 
-        # We now convert the data into an Uncertainty Annotated Map
-        uam = osm_loader.to_cartesian_map()
+    # Annotate the same level of uncertainty on all features
+    uam.apply_covariance(10.0 * eye(2))
 
-        # We can add extra information, e.g., from background knowledge or other sensors
-        # Here, we place the drone operator at the center of the map
-        uam.features.append(CartesianLocation(0, 0, location_type="operator"))
+    uam.save(f"./cache/uam_{hashVal}.pickle")
 
-        # Annotate the same level of uncertainty on all features
-        uam.apply_covariance(10.0 * eye(2))
-        
-        uam.save(f"./cache/uam_{hashVal}.pickle")
+    return uam
 
+@lru_cache(maxsize=32)
+def raster_band(
+    origin: tuple[float, float],
+    resolution: tuple[int, int],
+    dimensions: tuple[int, int]
+) -> CartesianRasterBand:
+    # Raster bands are only read from, so equal ones are shared between StaR Map and ProMis
+    mission_center = PolarLocation(latitude=origin[0], longitude=origin[1])
+    width, height = dimensions
+    return CartesianRasterBand(mission_center, resolution, width, height)
+
+def build_star_map(
+    origin: tuple[float, float],
+    uam: CartesianMap,
+    relations: list[tuple[str, str]],
+    dimensions: tuple[int, int],
+    target_resolution: tuple[int, int],
+    support_resolution: tuple[int, int],
+    number_of_random_maps: int
+) -> StaRMap:
     # We create a statistical relational map (StaR Map) to represent the 
     # stochastic relationships in the environment, computing a raster of 1000 x 1000 points
     # using linear interpolation of a sample set
-    target_resolution = req.resolutions
-    target = CartesianRasterBand(mission_center, target_resolution, width, height)
-    star_map = StaRMap(target, uam, list(location_types.keys()), "linear")
+    target = raster_band(origin, target_resolution, dimensions)
+    star_map = StaRMap(target, uam, "linear")
 
     # The sample points for which the relations will be computed directly
-    support_resolution = target_resolution
-    support = CartesianRasterBand(mission_center, support_resolution, width, height)
+    support = raster_band(origin, support_resolution, dimensions)
 
     # We now compute the Distance and Over relationships for the selected points
-    # For this, we take 25 random samples from generated/possible map variations
-    star_map.add_support_points(support, 25)
+    # For this, we take a number of random samples from generated/possible map variations
+    for relation, location_type in relations:
+        star_map.add_support_points(support, number_of_random_maps, [relation], [location_type])
+
+    return star_map
+
+@app.post("/runpromis")
+async def run_new(req: Item):
+    # The mission landscape is centered at the requested origin
+    dimensions = req.dimensions
+
+    # We load geographic features from OpenStreetMap using a range of filters,
+    # skipping those that the logic program never relates to
+    necessary_types = find_necessary_type(req.source)
+    location_types = {
+        name: osm_filter
+        for name, osm_filter in req.location_types.items()
+        if name in necessary_types
+    }
+    if len(location_types) < len(req.location_types):
+        print(f"skipping unused location types {set(req.location_types) - necessary_types}")
+
+    # Blocking stages run in worker threads to keep the event loop responsive
+    uam = await asyncio.to_thread(
+        build_uam, req.origin, dimensions, tuple(location_types.items())
+    )
+
+    # The relations that ProMis will query from the StaR Map
+    relations = sorted(StaRMap.get_mentioned_relations(req.source))
+
+    # The StaR Map depends on the environment and the relations it holds, so it is
+    # shared by all requests that describe the same ones
+    number_of_random_maps = 25
+    target_resolution = req.resolutions
+    support_resolution = target_resolution
+    star_map_key = (
+        req.origin,
+        dimensions,
+        tuple(location_types.items()),
+        tuple(relations),
+        target_resolution,
+        support_resolution,
+        number_of_random_maps,
+    )
+
+    star_map = star_map_cache.get(star_map_key)
+    if star_map is not None:
+        star_map_cache.move_to_end(star_map_key)
+    else:
+        star_map = await asyncio.to_thread(
+            build_star_map,
+            req.origin,
+            uam,
+            relations,
+            dimensions,
+            target_resolution,
+            support_resolution,
+            number_of_random_maps,
+        )
+        star_map_cache[star_map_key] = star_map
+        if len(star_map_cache) > STAR_MAP_CACHE_SIZE:
+            star_map_cache.popitem(last=False)
 
     # In ProMis, we define the constraints of the mission 
     # as hybrid probabilistic first-order logic program
     logic = req.source
 
     # Solve mission constraints using StaRMap parameters and multiprocessing
+    support = raster_band(req.origin, support_resolution, dimensions)
     promis = ProMis(star_map)
-    landscape = promis.solve(logic, n_jobs=4, batch_size=15)
+    landscape = await asyncio.to_thread(
+        promis.solve, support, logic, n_jobs=4, batch_size=None, pool=pool
+    )
 
     polar_pml = landscape.to_polar()
-    data = []
     longlats = polar_pml.coordinates()
     values = polar_pml.values()
     columns = polar_pml._polar_columns()
-    for i, longlat in enumerate(longlats):
-        long = longlat[0] if columns[0] == 'longitude' else longlat[1]
-        lat = longlat[1] if columns[1] == 'latitude' else longlat[0]
-        val = values[i][0]
-        data.append([lat, long, val])
-    return data
+
+    # Assemble [lat, long, val] rows in a single vectorized step
+    lat_index, long_index = (1, 0) if columns[0] == 'longitude' else (0, 1)
+    # Probabilities are only used for coloring, so shorter numbers suffice on the wire
+    data = column_stack(
+        [longlats[:, lat_index], longlats[:, long_index], around(values[:, 0], decimals=6)]
+    )
+
+    # Serialize the array directly with orjson instead of the generic JSON encoder
+    return Response(
+        orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY), media_type="application/json"
+    )
+
+@lru_cache(maxsize=4)
+def load_config(path: str, inode: int, size: int, mtime_ns: int) -> Config:
+    # The file's identity, size and modification time are part of the key, so edits on disk
+    # invalidate the cache even if they happen within the timestamp granularity
+    try:
+        return Config.model_validate_json(Path(path).read_bytes())
+    except ValidationError as e:
+        print(e)
+        raise HTTPException(status_code=500, detail="fail to parse config file")
+
+def write_json_atomically(path: str, content: bytes):
+    # Replacing the file in one step never leaves a partially written config behind,
+    # and a unique temporary file per writer keeps concurrent requests apart
+    descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            # mkstemp creates private files, the config keeps the usual permissions
+            os.fchmod(f.fileno(), 0o644)
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
 
 @app.post("/config")
 def update_config(config: Config):
-    with open('./config/config.json', 'w', encoding='utf-8') as f:
-        f.write(config.model_dump_json(indent=2))
+    write_json_atomically(
+        CONFIG_PATH, orjson.dumps(config.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+    )
 
 @app.get("/config")
 def get_config():
-    config = None
     try:
-        with open('./config/config.json', 'r') as f:
-            config = f.read()
-            try:
-                config = Config.model_validate_json(config)
-            except ValidationError as e:
-                print(e)
-                raise HTTPException(status_code=500, detail="fail to parse config file")
+        stat = os.stat(CONFIG_PATH)
+        return load_config(CONFIG_PATH, stat.st_ino, stat.st_size, stat.st_mtime_ns)
     except FileNotFoundError:
-        config = Config(layers=[], markers=[])
-
-    return config
+        return Config(layers=[], markers=[])
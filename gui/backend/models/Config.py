@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from .Layer import Layer
 from .Marker import Marker
 
 class Config(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     layers: list[Layer]
     markers: list[Marker]
\ No newline at end of file
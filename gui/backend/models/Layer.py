@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from .Point import Point
 
 class Layer(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     markers: list[Point]
@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class Marker(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     latlng: tuple[float, float]
     shape: str
     name: str 
\ No newline at end of file
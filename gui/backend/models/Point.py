@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class Point(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     position: tuple[float, float]
     probability: float
     radius: float
@@ -13,12 +13,11 @@
 from collections.abc import Callable
 
 # Third Party
-from numpy import ndarray
-from numpy.linalg import inv
+from numpy import ndarray, stack, swapaxes
 
 # ProMis
 from promis.estimators.filters.gmphd import GaussianMixturePhd
-from promis.models import Gaussian, GaussianMixture
+from promis.models import Gaussian, GaussianMixture  # noqa: F401, used in doctests
 
 
 class ExtendedGaussianMixturePhd(GaussianMixturePhd):
@@ -126,22 +125,32 @@ class ExtendedGaussianMixturePhd(GaussianMixturePhd):
         # Initializes internal linear model
         super().__init__(birth_belief, survival_rate, detection_rate, intensity, F, H, Q, R)
 
-    def forward_model(self, component: Gaussian, **kwargs) -> Gaussian:
-        F = self.F(component.x, **kwargs) if callable(self.F) else self.F
-
-        return Gaussian(
-            self.f(x=component.x, **kwargs),
-            F @ component.P @ F.T + self.Q,
-            component.w * self.survival_rate,
+    def forward_models(self, gmm: GaussianMixture, **kwargs) -> GaussianMixture:
+        if not gmm:
+            return GaussianMixture()
+
+        # Linearize about each component's mean
+        if callable(self.F):
+            F = stack([self.F(component.x, **kwargs) for component in gmm])
+        else:
+            F = self.F
+
+        # Propagate the stacked covariances in a single batched product
+        return GaussianMixture.from_arrays(
+            stack([self.f(x=component.x, **kwargs) for component in gmm]),
+            F @ gmm.covariances @ swapaxes(F, -1, -2) + self.Q,
+            gmm.weights * self.survival_rate,
         )
 
-    def measurement_model(self, component: Gaussian, **kwargs):
+    def measurement_models(
+        self, gmm: GaussianMixture, **kwargs
+    ) -> tuple[ndarray, ndarray, ndarray, ndarray]:
         # Approximate about predicted state
-        h_x: ndarray = self.H(component.x, **kwargs) if callable(self.H) else self.H
+        if callable(self.H):
+            h_x = stack([self.H(component.x, **kwargs) for component in gmm])
+        else:
+            h_x = self.H
 
-        mu = self.h(component.x, **kwargs)
-        S = self.R + h_x @ component.P @ h_x.T
-        K = component.P @ h_x.T @ inv(S)
-        P = component.P - K @ S @ K.T
+        mu = stack([self.h(component.x, **kwargs) for component in gmm])
 
-        return mu, S, K, P
+        return self.update_terms(mu, h_x, gmm.covariances)
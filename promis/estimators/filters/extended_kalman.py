@@ -11,12 +11,11 @@
 
 # Standard Library
 from collections.abc import Callable
-from copy import deepcopy
 
 # Third Party
 from numpy import ndarray
-from numpy.linalg import inv
-from pandas import DataFrame, concat
+from pandas import DataFrame
+from scipy.linalg import cho_factor, cho_solve
 
 # ProMis
 from promis.models import Gaussian
@@ -97,8 +96,8 @@ class ExtendedKalman:
         keep_trace: bool = False,
     ):
         # Initial belief
-        self.estimate = deepcopy(estimate)
-        self.prediction = deepcopy(estimate)
+        self.estimate = estimate.copy()
+        self.prediction = estimate.copy()
 
         # Model specification
         self.f = f
@@ -115,10 +114,22 @@ class ExtendedKalman:
         # Kalman gain
         self.K: ndarray
 
-        # Objects for process tracing
+        # Objects for process tracing, collected as rows and only turned into DataFrames on access
         self.keep_trace = keep_trace
-        self.predictions = DataFrame(columns=["x", "P", "F"])
-        self.estimates = DataFrame(columns=["x", "P", "z"])
+        self._predictions: list[dict[str, ndarray]] = []
+        self._estimates: list[dict[str, ndarray]] = []
+
+    @property
+    def predictions(self) -> DataFrame:
+        """The traced predictions with columns `"x"`, `"P"` and `"F"`."""
+
+        return DataFrame(self._predictions, columns=["x", "P", "F"])
+
+    @property
+    def estimates(self) -> DataFrame:
+        """The traced estimates with columns `"x"`, `"P"` and `"z"`."""
+
+        return DataFrame(self._estimates, columns=["x", "P", "z"])
 
     def predict(self, **kwargs) -> None:
         """Predict a future state based on a linear forward model with optional system input."""
@@ -132,14 +143,9 @@ class ExtendedKalman:
 
         # Append prediction data to trace
         if self.keep_trace:
-            new = DataFrame(
-                {
-                    "x": (self.prediction.x.copy(),),
-                    "P": (self.prediction.P.copy(),),
-                    "F": (F.copy(),),
-                }
+            self._predictions.append(
+                {"x": self.prediction.x.copy(), "P": self.prediction.P.copy(), "F": F.copy()}
             )
-            self.predictions = concat([self.predictions, new], ignore_index=True)
 
     def correct(self, z: ndarray, **kwargs) -> None:
         """Correct a state prediction based on a measurement."""
@@ -150,21 +156,24 @@ class ExtendedKalman:
         # Approximate about predicted state
         h_x: ndarray = H(self.prediction.x, **kwargs) if callable(H) else H
 
+        # Cross covariance of state and measurement, shared by all following terms
+        cross_covariance = self.prediction.P @ h_x.T
+
         # Compute the residual and its covariance
         self.y = z - h(self.prediction.x, **kwargs)
-        self.S = h_x @ self.prediction.P @ h_x.T + self.R
+        self.S = h_x @ cross_covariance + self.R
 
-        # Compute the new Kalman gain
-        self.K = self.prediction.P @ h_x.T @ inv(self.S)
+        # Compute the new Kalman gain by solving S K^T = (P H^T)^T instead of inverting S,
+        # using a Cholesky factorization since S is symmetric positive definite
+        self.K = cho_solve(cho_factor(self.S), cross_covariance.T).T
 
-        # Estimate new state
+        # Estimate new state, where K S K^T = K (P H^T)^T
         self.estimate = Gaussian(
-            self.prediction.x + self.K @ self.y, self.prediction.P - self.K @ self.S @ self.K.T
+            self.prediction.x + self.K @ self.y, self.prediction.P - self.K @ cross_covariance.T
         )
 
         # Append estimation data to trace
         if self.keep_trace:
-            new = DataFrame(
-                {"x": (self.estimate.x.copy(),), "P": (self.estimate.P.copy(),), "z": (z.copy(),)}
+            self._estimates.append(
+                {"x": self.estimate.x.copy(), "P": self.estimate.P.copy(), "z": z.copy()}
             )
-            self.estimates = concat([self.estimates, new], ignore_index=True)
@@ -11,11 +11,10 @@
 
 # Standard Library
 from collections.abc import Callable
-from copy import deepcopy
 
 # Third Party
-from numpy import ndarray
-from numpy.linalg import inv
+from numpy import array_equal, diagonal, exp, kron, log, ndarray, pi, stack, swapaxes, tile
+from numpy.linalg import cholesky, solve
 
 # ProMis
 from promis.models import Gaussian, GaussianMixture
@@ -138,41 +137,152 @@ class GaussianMixturePhd:
         # Gaussian mixture model
         self.gmm = GaussianMixture()
 
+        # Constant transition model and its Kronecker product, computed on first use
+        self._transition: tuple[ndarray, ndarray] | None = None
+
     def forward_model(self, component: Gaussian, **kwargs) -> Gaussian:
-        # Compute F if additional parameters are needed
-        F = self.F(**kwargs) if callable(self.F) else self.F
+        return self.forward_models(GaussianMixture([component]), **kwargs)[0]
+
+    def forward_models(self, gmm: GaussianMixture, **kwargs) -> GaussianMixture:
+        """Predict all components of a mixture at once.
+
+        Args:
+            gmm: The mixture whose components are propagated through the forward model
+
+        Returns:
+            The predicted mixture
+        """
 
-        return Gaussian(
-            F @ component.x,
-            F @ component.P @ F.T + self.Q,
-            component.w * self.survival_rate,
+        if not gmm:
+            return GaussianMixture()
+
+        covariances = gmm.covariances
+        k, n, _ = covariances.shape
+
+        # Compute F if additional parameters are needed, otherwise F P F^T is applied to
+        # all flattened covariances at once as (F kron F) vec(P) in a single matrix product
+        if callable(self.F):
+            F = self.F(**kwargs)
+            covariances = F @ covariances @ F.T
+        else:
+            F = self.F
+            covariances = (covariances.reshape(k, n * n) @ self.kronecker(F)).reshape(k, n, n)
+
+        # Propagate the stacked means and covariances in a single batched product each
+        return GaussianMixture.from_arrays(
+            F @ gmm.means,
+            covariances + self.Q,
+            gmm.weights * self.survival_rate,
         )
 
+    def kronecker(self, F: ndarray) -> ndarray:
+        """Get the transposed Kronecker product of a constant transition model with itself.
+
+        The product is kept for as long as the transition model's values stay the same,
+        which also covers models that are modified in place.
+
+        Args:
+            F: The linear state transition model (n, n)
+
+        Returns:
+            The transposed Kronecker product of F with itself (n * n, n * n)
+        """
+
+        # Compare against a private copy, as F itself may have been modified in place
+        if self._transition is None or not array_equal(self._transition[0], F):
+            self._transition = (F.copy(), kron(F, F).T)
+
+        return self._transition[1]
+
     def measurement_model(self, component: Gaussian, **kwargs):
+        mu, S, K, P = self.measurement_models(GaussianMixture([component]), **kwargs)
+
+        return mu[0], S[0], K[0], P[0]
+
+    def measurement_models(
+        self, gmm: GaussianMixture, **kwargs
+    ) -> tuple[ndarray, ndarray, ndarray, ndarray]:
+        """Compute the update terms of all components of a mixture at once.
+
+        Args:
+            gmm: The mixture whose components are mapped into measurement space
+
+        Returns:
+            The stacked measurement space means, residual covariances, gains and
+            updated covariances, one entry per component
+        """
+
         # Compute H if additional parameters are needed
-        H = self.H(component.x, **kwargs) if callable(self.H) else self.H
+        if callable(self.H):
+            H = stack([self.H(component.x, **kwargs) for component in gmm])
+        else:
+            H = self.H
 
-        mu = H @ component.x
-        S = self.R + H @ component.P @ H.T
-        K = component.P @ H.T @ inv(S)
-        P = component.P - K @ S @ K.T
+        return self.update_terms(H @ gmm.means, H, gmm.covariances)
 
-        return mu, S, K, P
+    def update_terms(
+        self, mu: ndarray, H: ndarray, P: ndarray
+    ) -> tuple[ndarray, ndarray, ndarray, ndarray]:
+        """Compute the batched Kalman update terms of stacked components.
+
+        Args:
+            mu: The means mapped to measurement space (k, m, 1)
+            H: The measurement model, either shared (m, n) or per component (k, m, n)
+            P: The covariances of the components (k, n, n)
+
+        Returns:
+            The means, residual covariances, gains and updated covariances
+        """
+
+        # Cross covariance of state and measurement, shared by all following terms
+        cross_covariance = P @ swapaxes(H, -1, -2)
+
+        # Solve S K^T = (P H^T)^T instead of inverting S, where K S K^T = K (P H^T)^T
+        S = self.R + H @ cross_covariance
+        K = swapaxes(solve(S, swapaxes(cross_covariance, -1, -2)), -1, -2)
+
+        return mu, S, K, P - K @ swapaxes(cross_covariance, -1, -2)
+
+    @staticmethod
+    def likelihoods(residuals: ndarray, S: ndarray) -> ndarray:
+        """Evaluate the Gaussian densities of all residuals at once.
+
+        Each residual covariance is factorized only once and the factor is reused
+        for every measurement, instead of setting up a distribution per pair.
+
+        Args:
+            residuals: Differences of measurements and component means (M, N, m, 1)
+            S: The residual covariances of the components (N, m, m)
+
+        Returns:
+            The densities of all pairs of measurement and component (M, N)
+        """
+
+        # S = L L^T, such that the squared Mahalanobis distance of r is |w|^2 with L w = r
+        lower = cholesky(S)
+
+        # Solve for the residuals of all measurements to a component at once (N, m, M)
+        whitened = solve(lower, residuals[..., 0].transpose(1, 2, 0))
+        mahalanobis = (whitened**2).sum(axis=-2).T
+
+        # det(S) is the squared product of the diagonal of L
+        log_determinant = 2 * log(diagonal(lower, axis1=-2, axis2=-1)).sum(axis=-1)
+        log_normalization = 0.5 * (S.shape[-1] * log(2 * pi) + log_determinant)
+
+        return exp(-0.5 * mahalanobis - log_normalization)
 
     def predict(self, **kwargs) -> None:
         """Predict the future state."""
 
         # Spontaneous birth of new targets
-        born = deepcopy(self.birth_belief)
+        born = self.birth_belief.copy()
 
         # Spawning off of existing targets
         # TODO: Spawning not implemented at this point in time
         spawned = GaussianMixture()
 
         # Prediction for existing targets
-        predicted = GaussianMixture()
-        for component in self.gmm:
-            predicted.append(self.forward_model(component, **kwargs))
+        predicted = self.forward_models(self.gmm, **kwargs)
 
         # Concatenate with newborn and spawned target components
         self.gmm = predicted + born + spawned
@@ -184,51 +294,44 @@ class GaussianMixturePhd:
             measurements: Measurements at this timestep
         """
 
+        # Without components there is nothing to correct
+        if not self.gmm:
+            return
+
         # ######################################
         # Construction of update components
 
-        mu: list[ndarray] = []  # Means mapped to measurement space
-        S: list[ndarray] = []  # Residual covariance
-        K: list[ndarray] = []  # Gains
-        P: list[ndarray] = []  # Covariance
-
-        for i, component in enumerate(self.gmm):
-            results = self.measurement_model(component, **kwargs)
-
-            mu.append(results[0])
-            S.append(results[1])
-            K.append(results[2])
-            P.append(results[3])
+        # Means mapped to measurement space, residual covariances, gains and covariances
+        mu, S, K, P = self.measurement_models(self.gmm, **kwargs)
 
         # ######################################
         # Update
 
-        # Undetected assumption
-        updated = deepcopy(self.gmm)
-        for component in updated:
-            component.weight *= 1 - self.detection_rate
-
-        # Measured assumption
-        for z in range(measurements.shape[1]):
-            # Fill batch with corrected components
-            batch = GaussianMixture(
-                [
-                    Gaussian(
-                        self.gmm[i].x + K[i] @ (measurements[:, [z]] - mu[i]),
-                        P[i],
-                        self.detection_rate * Gaussian(mu[i], S[i])(measurements[:, [z]]),
-                    )
-                    for i in range(len(self.gmm))
-                ]
-            )
-
-            # Normalize weights
-            sum_of_weights = sum([component.weight for component in batch])
-            for component in batch:
-                component.weight /= self.intensity + sum_of_weights
-
-            # Append batch to updated GMM
-            updated += batch
+        # Undetected assumption, scaling all weights at once
+        predicted_means = self.gmm.means
+        updated = GaussianMixture.from_arrays(
+            predicted_means, self.gmm.covariances, self.gmm.weights * (1 - self.detection_rate)
+        )
+
+        # Corrected means of all pairs of measurement and component (M, N, n, 1)
+        residuals = measurements.T[:, None, :, None] - mu
+        means = predicted_means + K @ residuals
+
+        # Likelihoods of all pairs of measurement and component (M, N)
+        likelihoods = self.likelihoods(residuals, S)
+
+        # Measured assumption, with the weights of each measurement's batch normalized
+        weights = self.detection_rate * likelihoods
+        weights /= self.intensity + weights.sum(axis=1, keepdims=True)
+
+        # Append the batches of all measurements to the updated GMM in a single step,
+        # with the components' parameters laid out in contiguous arrays
+        n = means.shape[-2]
+        updated += GaussianMixture.from_arrays(
+            means.reshape(-1, n, 1),
+            tile(P, (measurements.shape[1], 1, 1)),
+            weights.reshape(-1),
+        )
 
         # Set updated as new gaussian mixture model
         self.gmm = updated
@@ -11,12 +11,11 @@
 
 # Standard Library
 from collections.abc import Callable
-from copy import deepcopy
 
 # Third Party
 from numpy import ndarray
-from numpy.linalg import inv
-from pandas import DataFrame, concat
+from pandas import DataFrame
+from scipy.linalg import cho_factor, cho_solve
 
 # ProMis
 from promis.models import Gaussian
@@ -129,8 +128,8 @@ class Kalman:
         keep_trace: bool = False,
     ):
         # Initial belief
-        self.estimate = deepcopy(estimate)
-        self.prediction = deepcopy(estimate)
+        self.estimate = estimate.copy()
+        self.prediction = estimate.copy()
 
         # Model specification
         self.F = F
@@ -139,10 +138,22 @@ class Kalman:
         self.Q = Q
         self.R = R
 
-        # Objects for process tracing
+        # Objects for process tracing, collected as rows and only turned into DataFrames on access
         self.keep_trace = keep_trace
-        self.predictions = DataFrame(columns=["x", "P", "F"])
-        self.estimates = DataFrame(columns=["x", "P", "z"])
+        self._predictions: list[dict[str, ndarray]] = []
+        self._estimates: list[dict[str, ndarray]] = []
+
+    @property
+    def predictions(self) -> DataFrame:
+        """The traced predictions with columns `"x"`, `"P"` and `"F"`."""
+
+        return DataFrame(self._predictions, columns=["x", "P", "F"])
+
+    @property
+    def estimates(self) -> DataFrame:
+        """The traced estimates with columns `"x"`, `"P"` and `"z"`."""
+
+        return DataFrame(self._estimates, columns=["x", "P", "z"])
 
     def predict(self, **kwargs) -> None:
         """Predict a future state based on a linear forward model with optional system input."""
@@ -162,14 +173,9 @@ class Kalman:
 
         # Append prediction data to trace
         if self.keep_trace:
-            new = DataFrame(
-                {
-                    "x": (self.prediction.x.copy(),),
-                    "P": (self.prediction.P.copy(),),
-                    "F": (F.copy(),),
-                }
+            self._predictions.append(
+                {"x": self.prediction.x.copy(), "P": self.prediction.P.copy(), "F": F.copy()}
             )
-            self.predictions = concat([self.predictions, new], ignore_index=True)
 
     def correct(self, z: ndarray, **kwargs) -> None:
         """Correct a state prediction based on a measurement.
@@ -185,22 +191,25 @@ class Kalman:
         if callable(H):
             H = H(**kwargs)
 
+        # Cross covariance of state and measurement, shared by all following terms
+        cross_covariance = self.prediction.P @ H.T
+
         # Compute the residual and its covariance
         y = z - H @ self.prediction.x
-        S = H @ self.prediction.P @ H.T + self.R
+        S = H @ cross_covariance + self.R
 
-        # Compute the new Kalman gain
-        K = self.prediction.P @ H.T @ inv(S)
+        # Compute the new Kalman gain by solving S K^T = (P H^T)^T instead of inverting S,
+        # using a Cholesky factorization since S is symmetric positive definite
+        K = cho_solve(cho_factor(S), cross_covariance.T).T
 
-        # Estimate new state
+        # Estimate new state, where K S K^T = K (P H^T)^T
         self.estimate = Gaussian(
             self.prediction.x + K @ y,
-            self.prediction.P - K @ S @ K.T,
+            self.prediction.P - K @ cross_covariance.T,
         )
 
         # Append estimation data to trace
         if self.keep_trace:
-            new = DataFrame(
-                {"x": (self.estimate.x.copy(),), "P": (self.estimate.P.copy(),), "z": (z.copy(),)}
+            self._estimates.append(
+                {"x": self.estimate.x.copy(), "P": self.estimate.P.copy(), "z": z.copy()}
             )
-            self.estimates = concat([self.estimates, new], ignore_index=True)
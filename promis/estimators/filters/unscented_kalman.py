@@ -11,13 +11,11 @@
 
 # Standard Library
 from collections.abc import Callable
-from copy import deepcopy
 
 # Third Party
-from numpy import array, hstack, ndarray, outer, tensordot, vectorize, vstack
-from numpy.linalg import inv
-from pandas import DataFrame, concat
-from scipy.linalg import cholesky
+from numpy import array, einsum, hstack, ndarray, vstack
+from pandas import DataFrame
+from scipy.linalg import cho_factor, cho_solve, cholesky
 
 # ProMis
 from promis.models import Gaussian
@@ -102,8 +100,8 @@ class UnscentedKalman:
         keep_trace: bool = False,
     ):
         # Initial belief
-        self.estimate = deepcopy(estimate)
-        self.prediction = deepcopy(estimate)
+        self.estimate = estimate.copy()
+        self.prediction = estimate.copy()
 
         # Model specification
         self.f = f
@@ -131,10 +129,22 @@ class UnscentedKalman:
         self.cov_weights: ndarray
         self.setup_weights()
 
-        # Objects for process tracing
+        # Objects for process tracing, collected as rows and only turned into DataFrames on access
         self.keep_trace = keep_trace
-        self.predictions = DataFrame(columns=["x", "P", "X", "Y"])
-        self.estimates = DataFrame(columns=["x", "P", "z"])
+        self._predictions: list[dict[str, ndarray]] = []
+        self._estimates: list[dict[str, ndarray]] = []
+
+    @property
+    def predictions(self) -> DataFrame:
+        """The traced predictions with columns `"x"`, `"P"`, `"X"` and `"Y"`."""
+
+        return DataFrame(self._predictions, columns=["x", "P", "X", "Y"])
+
+    @property
+    def estimates(self) -> DataFrame:
+        """The traced estimates with columns `"x"`, `"P"` and `"z"`."""
+
+        return DataFrame(self._estimates, columns=["x", "P", "z"])
 
     def setup_weights(self) -> None:
         """Computes mean and covariance weights for unscented transform"""
@@ -168,30 +178,26 @@ class UnscentedKalman:
 
         # Compute and propagate Merwe points
         self.compute_sigma_points()
-        self.Y = vectorize(lambda x: self.f(x, **kwargs), signature="(m)->(n)")(self.X.T).T
+        self.Y = array([self.f(x, **kwargs) for x in self.X.T]).T
 
-        # Predict next state as mean of distribution
+        # Predict next state as mean of distribution, with the covariance as weighted
+        # sum of outer products of the sigma points' deviations in a single contraction
+        deviations = self.Y - self.prediction.x
         self.prediction = Gaussian(
             vstack(self.mean_weights @ self.Y.T),
-            tensordot(
-                self.cov_weights,
-                [outer(y - self.prediction.x.T, y - self.prediction.x.T) for y in self.Y.T],
-                axes=1,
-            )
-            + self.Q,
+            einsum("k,ik,jk->ij", self.cov_weights, deviations, deviations) + self.Q,
         )
 
         # Append prediction data to trace
         if self.keep_trace:
-            new = DataFrame(
+            self._predictions.append(
                 {
-                    "x": (self.prediction.x.copy(),),
-                    "P": (self.prediction.P.copy(),),
-                    "X": (deepcopy(self.X),),
-                    "Y": (deepcopy(self.Y),),
+                    "x": self.prediction.x.copy(),
+                    "P": self.prediction.P.copy(),
+                    "X": self.X.copy(),
+                    "Y": self.Y.copy(),
                 }
             )
-            self.predictions = concat([self.predictions, new], ignore_index=True)
 
     def correct(self, z: ndarray, **kwargs) -> None:
         """Correct a state prediction based on a measurement."""
@@ -200,34 +206,37 @@ class UnscentedKalman:
         h = kwargs.pop("h", self.h)
 
         # Compute measurement distribution
-        self.Z = vectorize(lambda y: h(y, **kwargs), signature="(m)->(n)")(self.Y.T).T
+        self.Z = array([h(y, **kwargs) for y in self.Y.T]).T
         mean_z = vstack(self.mean_weights @ self.Z.T)
 
+        # Deviations of the sigma points from the predicted state and measurement
+        state_deviations = self.Y - self.prediction.x
+        measurement_deviations = self.Z - mean_z
+
         # Compute the residual and its covariance
         self.y = z - mean_z
         self.S = (
-            tensordot(
-                self.cov_weights, [outer(z - mean_z.T, z - mean_z.T) for z in self.Z.T], axes=1
-            )
+            einsum("k,ik,jk->ij", self.cov_weights, measurement_deviations, measurement_deviations)
             + self.R
         )
 
-        # Compute the new Kalman gain
-        self.K = tensordot(
-            self.cov_weights,
-            [outer(y - self.prediction.x.T, z - mean_z.T) for y, z in zip(self.Y.T, self.Z.T)],
-            axes=1,
-        ) @ inv(self.S)
+        # Cross covariance P_xz of state and measurement
+        cross_covariance = einsum(
+            "k,ik,jk->ij", self.cov_weights, state_deviations, measurement_deviations
+        )
+
+        # Compute the new Kalman gain by solving S K^T = (P_xz)^T instead of inverting S,
+        # using a Cholesky factorization since S is symmetric positive definite
+        self.K = cho_solve(cho_factor(self.S), cross_covariance.T).T
 
-        # Estimate new state
+        # Estimate new state, where K S K^T = K (P_xz)^T
         self.estimate = Gaussian(
             self.prediction.x + self.K @ self.y,
-            self.prediction.P - self.K @ self.S @ self.K.T,
+            self.prediction.P - self.K @ cross_covariance.T,
         )
 
         # Append estimation data to trace
         if self.keep_trace:
-            new = DataFrame(
-                {"x": (self.estimate.x.copy(),), "P": (self.estimate.P.copy(),), "z": (z.copy(),)}
+            self._estimates.append(
+                {"x": self.estimate.x.copy(), "P": self.estimate.P.copy(), "z": z.copy()}
             )
-            self.estimates = concat([self.estimates, new], ignore_index=True)
@@ -14,8 +14,8 @@ from collections.abc import Callable
 
 # Third Party
 from numpy import ndarray
-from numpy.linalg import inv
 from pandas import DataFrame
+from scipy.linalg import cho_factor, cho_solve
 
 # ProMis
 from promis.estimators.filters import Kalman
@@ -107,27 +107,28 @@ class Rts(Kalman):
             The smoothed data with columns `"x"` and `"P"`
         """
 
-        # Dataframe of smoothed estimates
+        # Work on the traced rows directly, as indexing into DataFrames is slow
+        predictions = self._predictions
+        estimates = self._estimates
+
         # The latest estimated cannot be improved
-        smoothed = DataFrame(columns=["x", "P"])
-        smoothed.loc[self.estimates.index[-1]] = {
-            "x": self.estimates.iloc[-1].x,
-            "P": self.estimates.iloc[-1].P,
-        }
+        x, P = estimates[-1]["x"], estimates[-1]["P"]
+        smoothed = [{"x": x, "P": P}]
 
         # Recursively go back in time
-        for i in self.estimates.index[-2::-1]:
+        for i in range(len(estimates) - 2, -1, -1):
             # Access next predictions and estimates for smoothing
-            prediction = self.predictions.iloc[i + 1]
-            estimate = self.estimates.iloc[i]
+            prediction = predictions[i + 1]
+            estimate = estimates[i]
 
-            # Compute smoothing gain
-            G = estimate.P @ prediction.F @ inv(prediction.P)
+            # Compute smoothing gain by solving with the symmetric positive definite
+            # predicted covariance instead of inverting it
+            G = cho_solve(cho_factor(prediction["P"]), (estimate["P"] @ prediction["F"]).T).T
 
-            # Append to smoothed DataFrame
-            smoothed.loc[i] = {
-                "x": estimate.x + G @ (smoothed.loc[i + 1].x - prediction.x),
-                "P": estimate.P + G @ (smoothed.loc[i + 1].P - prediction.P) @ G.T,
-            }
+            # Append to smoothed estimates
+            x = estimate["x"] + G @ (x - prediction["x"])
+            P = estimate["P"] + G @ (P - prediction["P"]) @ G.T
+            smoothed.append({"x": x, "P": P})
 
-        return smoothed
+        # Dataframe of smoothed estimates, from the latest one back in time
+        return DataFrame(smoothed, columns=["x", "P"], index=range(len(estimates) - 1, -1, -1))
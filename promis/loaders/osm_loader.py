@@ -9,10 +9,11 @@
 #
 
 # Standard Library
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 
 # Third Party
-from overpy import Overpass, Relation
+from overpy import Overpass, Relation, Result
 from overpy.exception import OverpassGatewayTimeout, OverpassTooManyRequests
 
 # ProMis
@@ -38,9 +39,56 @@ class OsmLoader(SpatialLoader):
             self.load(feature_description)
 
     def load(self, feature_description: dict):
-        for location_type, osm_filter in feature_description.items():
-            self.load_routes(osm_filter, location_type)
-            self.load_polygons(osm_filter, location_type)
+        """Loads routes and polygons for all location types from OSM.
+
+        The queries for different location types are independent and I/O-bound,
+        so they are issued concurrently and merged in the given order.
+
+        Args:
+            feature_description: A mapping from location type to the OSM filter to load it with
+        """
+
+        if not feature_description:
+            return
+
+        # Public Overpass instances only grant a few concurrent slots per client
+        with ThreadPoolExecutor(max_workers=min(2, len(feature_description))) as executor:
+            loaded_features = executor.map(self._load_type, feature_description.items())
+
+            for features in loaded_features:
+                self.features += features
+
+    def _load_type(self, location_type_and_filter: tuple[str, str]) -> list:
+        # Load into a separate loader so concurrent queries do not share state
+        location_type, osm_filter = location_type_and_filter
+        loader = OsmLoader(self.origin, self.dimensions, None)
+        loader.load_routes(osm_filter, location_type)
+        loader.load_polygons(osm_filter, location_type)
+
+        return loader.features
+
+    def query(self, query: str, timeout: float = 5.0, attempts: int = 3) -> Result | None:
+        """Runs a query against Overpass, waiting and retrying while the server is busy.
+
+        Args:
+            query: The Overpass QL query to run
+            timeout: How long to wait before retrying a query that was rejected
+            attempts: How often to try the query before giving up
+
+        Returns:
+            The result of the query, or None if it could not be obtained
+        """
+
+        for _ in range(attempts):
+            try:
+                return self.overpass_api.query(query)
+            except (OverpassGatewayTimeout, OverpassTooManyRequests):
+                print(f"OSM query failed, sleeping {timeout}s...")
+                sleep(timeout)
+            except Exception:
+                return None
+
+        return None
 
     def load_routes(
         self,
@@ -65,19 +113,17 @@ class OsmLoader(SpatialLoader):
         bounding_box = f"({south:.4f}, {west:.4f}, {north:.4f}, {east:.4f})"
 
         # Load data via Overpass
-        try:
-            result = self.overpass_api.query(
-                f"""
-                    [out:json];
-                    way{filters}{bounding_box};
-                    out geom{bounding_box};>;out;
-                """
-            )
-        except (OverpassGatewayTimeout, OverpassTooManyRequests):
-            print(f"OSM query failed, sleeping {timeout}s...")
-            sleep(timeout)
-        except Exception:
-            result = []
+        result = self.query(
+            f"""
+                [out:json];
+                way{filters}{bounding_box};
+                out geom{bounding_box};>;out;
+            """,
+            timeout,
+        )
+
+        if result is None:
+            return
 
         # Add to features
         self.features += [
@@ -117,12 +163,13 @@ class OsmLoader(SpatialLoader):
 
         # Load data via Overpass
         try:
-            way_result = self.overpass_api.query(
+            way_result = self.query(
                 f"""
                     [out:json];
                     way{filters}{bounding_box};
                     out geom{bounding_box};>;out;
-                """
+                """,
+                timeout,
             )
 
             way_polygons = (
@@ -140,19 +187,17 @@ class OsmLoader(SpatialLoader):
                 if way_result
                 else []
             )
-        except (OverpassGatewayTimeout, OverpassTooManyRequests):
-            print(f"OSM query failed, sleeping {timeout}s...")
-            sleep(timeout)
         except Exception:
             way_polygons = []
 
         try:
-            relation_result = self.overpass_api.query(
+            relation_result = self.query(
                 f"""
                     [out:json];
                     relation{filters}{bounding_box};
                     out geom{bounding_box};>;out;
-                """
+                """,
+                timeout,
             )
 
             relation_polygons = (
@@ -163,9 +208,6 @@ class OsmLoader(SpatialLoader):
                 if relation_result
                 else []
             )
-        except (OverpassGatewayTimeout, OverpassTooManyRequests):
-            print(f"OSM query failed, sleeping {timeout}s...")
-            sleep(timeout)
         except Exception:
             relation_polygons = []
 
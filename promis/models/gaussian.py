@@ -9,7 +9,8 @@
 #
 
 # Standard Library
-from typing import cast
+from functools import cached_property
+from typing import Any, cast
 
 # Third Party
 from numpy import ndarray, vstack
@@ -78,8 +79,17 @@ class Gaussian:
         self.covariance = covariance
         self.weight = weight
 
-        # Abstract away from the scipy implementation
-        self.distribution = multivariate_normal(mean=self.mean.T[0], cov=self.covariance)
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Quantities derived from the parameters are recomputed on their next use
+        if name in ("mean", "covariance"):
+            self.__dict__.pop("distribution", None)
+
+        super().__setattr__(name, value)
+
+    @cached_property
+    def distribution(self) -> Any:
+        # Abstract away from the scipy implementation, which is only set up if needed
+        return multivariate_normal(mean=self.mean.T[0], cov=self.covariance)
 
     @property
     def x(self) -> ndarray:
@@ -93,6 +103,15 @@ class Gaussian:
     def w(self) -> float:
         return self.weight
 
+    def copy(self) -> "Gaussian":
+        """Create an independent copy of this Gaussian.
+
+        Returns:
+            A Gaussian with copies of this one's mean and covariance and the same weight
+        """
+
+        return Gaussian(self.mean.copy(), self.covariance.copy(), self.weight)
+
     def sample(self, number_of_samples: int = 1) -> ndarray:
         """Draw a number of samples following this Gaussian's distribution.
 
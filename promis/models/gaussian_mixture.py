@@ -8,12 +8,9 @@
 # If not, see https://opensource.org/license/bsd-3-clause/.
 #
 
-# Standard Library
-from copy import deepcopy
-
 # Third Party
-from numpy import array, ndarray
-from numpy.linalg import inv
+from numpy import argmax, argsort, array, einsum, empty, ndarray, sort, stack, swapaxes
+from numpy.linalg import solve
 
 # ProMis
 from promis.models.gaussian import Gaussian
@@ -43,6 +40,67 @@ class GaussianMixture:
     def __add__(self, other: "GaussianMixture") -> "GaussianMixture":
         return GaussianMixture(self.components + other.components)
 
+    @classmethod
+    def from_arrays(
+        cls, means: ndarray, covariances: ndarray, weights: ndarray
+    ) -> "GaussianMixture":
+        """Creates a mixture from stacked component parameters.
+
+        Args:
+            means: The means of all components (k, n, 1)
+            covariances: The covariances of all components (k, n, n)
+            weights: The weights of all components (k,)
+
+        Returns:
+            The mixture with one component per entry of the given arrays
+        """
+
+        return cls(
+            [
+                Gaussian(mean, covariance, float(weight))
+                for mean, covariance, weight in zip(means, covariances, weights)
+            ]
+        )
+
+    @property
+    def means(self) -> ndarray:
+        """The means of all components stacked into a single array (k, n, 1).
+
+        An empty mixture has no dimension, so its means are of shape (0, 0, 1).
+        """
+
+        if not self.components:
+            return empty((0, 0, 1))
+
+        return stack([component.x for component in self.components])
+
+    @property
+    def covariances(self) -> ndarray:
+        """The covariances of all components stacked into a single array (k, n, n).
+
+        An empty mixture has no dimension, so its covariances are of shape (0, 0, 0).
+        """
+
+        if not self.components:
+            return empty((0, 0, 0))
+
+        return stack([component.P for component in self.components])
+
+    @property
+    def weights(self) -> ndarray:
+        """The weights of all components as a single array (k,)."""
+
+        return array([component.w for component in self.components], dtype=float)
+
+    def copy(self) -> "GaussianMixture":
+        """Create an independent copy of this mixture.
+
+        Returns:
+            A mixture with copies of all of this one's components
+        """
+
+        return GaussianMixture([component.copy() for component in self.components])
+
     def append(self, component: Gaussian):
         """Appends a new Gaussian to this Mixture's list of components.
 
@@ -83,52 +141,58 @@ class GaussianMixture:
             max_components: Maximum number of gaussians after pruning
         """
 
+        # Without components there is nothing to prune
+        if not self.components:
+            return
+
         # Select a subset of components to be pruned
-        selected = [component for component in self.components if component.w > threshold]
+        means, covariances, weights = self.means, self.covariances, self.weights
+        selected = weights > threshold
+        means, covariances, weights = means[selected], covariances[selected], weights[selected]
 
-        # Create new list for pruned mixture model
-        pruned: list[Gaussian] = []
+        # Create new lists for pruned mixture model
+        pruned_means: list[ndarray] = []
+        pruned_covariances: list[ndarray] = []
+        pruned_weights: list[float] = []
 
         # While candidates for pruning exist ...
-        while selected:
+        while len(weights) > 0:
             # Find mean of component with maximum weight
-            index = max(range(len(selected)), key=lambda index: selected[index].w)
-
-            mean = selected[index].x
+            mean = means[argmax(weights)]
 
-            # Select components to be merged and remove merged from selected
-            mergeable = [
-                c
-                for c in selected
-                if ((c.x - mean).T @ inv(c.P) @ (c.x - mean)).item() <= merge_distance
-            ]
-            selected = [c for c in selected if c not in mergeable]
+            # Select components to be merged by their Mahalanobis distance to the mean
+            difference = means - mean
+            distance = einsum("kni,kni->k", difference, solve(covariances, difference))
+            mergeable = distance <= merge_distance
 
             # Compute new mixture component
-            merged_weight = sum([component.w for component in mergeable])
-            merged_mean = array(
-                sum([component.w * component.x for component in mergeable]) / merged_weight
-            )
-            merged_covariance = array(
-                sum(
-                    [
-                        component.w * (component.P + (mean - component.x) @ (mean - component.x).T)
-                        for component in mergeable
-                    ]
-                )
-                / merged_weight
+            merged_weights = weights[mergeable]
+            merged_weight = merged_weights.sum()
+            merged_mean = einsum("k,kni->ni", merged_weights, means[mergeable]) / merged_weight
+            spread = covariances[mergeable] + difference[mergeable] @ swapaxes(
+                difference[mergeable], -1, -2
             )
+            merged_covariance = einsum("k,knm->nm", merged_weights, spread) / merged_weight
 
             # Store the component
-            pruned.append(Gaussian(merged_mean, merged_covariance, merged_weight))
-
-        # Remove components with minimum weight if maximum number is exceeded
-        while len(pruned) > max_components:
-            # Find index of component with minimum weight
-            index = min(range(len(pruned)), key=lambda index: pruned[index].w)
-
-            # Remove the component
-            del pruned[index]
+            pruned_means.append(merged_mean)
+            pruned_covariances.append(merged_covariance)
+            pruned_weights.append(float(merged_weight))
+
+            # Remove merged components from selected
+            remaining = ~mergeable
+            means, covariances = means[remaining], covariances[remaining]
+            weights = weights[remaining]
+
+        # Remove components with minimum weight if maximum number is exceeded,
+        # keeping the order of the remaining components
+        kept = range(len(pruned_weights))
+        if len(pruned_weights) > max_components:
+            by_weight = argsort(array(pruned_weights), kind="stable")
+            kept = sort(by_weight[len(pruned_weights) - max_components :])
 
         # Update GMM with pruned model
-        self.components = deepcopy(pruned)
+        self.components = [
+            Gaussian(pruned_means[index], pruned_covariances[index], pruned_weights[index])
+            for index in kept
+        ]
@@ -10,7 +10,8 @@
 
 # Standard Library
 from copy import deepcopy
-from multiprocessing import Pool
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import Pool as WorkerPool
 
 # Third Party
 from numpy import array
@@ -38,7 +39,14 @@ class ProMis:
         self.star_map = star_map
 
     def solve(
-        self, support: CartesianCollection, logic: str, n_jobs: int = None, batch_size: int = 1, check_required_relations=True, method="linear"
+        self,
+        support: CartesianCollection,
+        logic: str,
+        n_jobs: int = None,
+        batch_size: int | None = 1,
+        check_required_relations=True,
+        method="linear",
+        pool: WorkerPool | None = None,
     ) -> CartesianCollection:
         """Solve the given ProMis problem.
 
@@ -47,26 +55,36 @@ class ProMis:
                 the employed StaRMap
             logic: The constraints of the landscape(X) predicate, including its definition
             n_jobs: How many workers to use in parallel
-            batch_size: How many pixels to infer at once
+            batch_size: How many pixels to infer at once, derived from the number of queries
+                and workers if None
             check_required_relations: Only get the relations explicitly mentioned in the logic
             method: Interpolation method, either 'linear' or 'nearest'
+            pool: An existing pool of workers to reuse, a new one with n_jobs workers is
+                created and closed again if None
 
         Returns:
             The Probabilistic Mission Landscape as well as time to
             generate the code, time to compile and time for inference in seconds.
         """
 
-        # During inference, we set the ProMis support points as StaRMap target
-        target = deepcopy(self.star_map.target)
-        self.star_map.target = support
+        # The output is interpolated to the StaRMap's target, which is left untouched
+        # so that a StaRMap can be shared by concurrent calls
+        target = self.star_map.target
 
-        # Get all relevant relations from the StaRMap
-        relations = self.star_map.get_from_logic(logic)
+        # Get all relevant relations from the StaRMap at the ProMis support points
+        relations = self.star_map.get_from_logic(logic, support)
 
         # For each point in the target CartesianCollection, we need to run a query
         number_of_queries = len(support.data)
         queries = [f"query(landscape(x_{index})).\n" for index in range(number_of_queries)]
 
+        # Give each worker a few batches to balance load against dispatch overhead
+        if batch_size is None:
+            workers = n_jobs if n_jobs is not None else cpu_count()
+            batch_size = max(1, number_of_queries // (workers * 4))
+
+        assert batch_size >= 1, "Batch size needs to be at least one!"
+
         # We batch up queries into separate programs
         solvers = []
         for index in range(0, number_of_queries, batch_size):
@@ -88,8 +106,11 @@ class ProMis:
             solvers.append(Solver(program))
 
         # Solve in parallel with pool of workers
-        with Pool(n_jobs) as pool:
+        if pool is not None:
             batched_results = pool.map(self.run_inference, solvers)
+        else:
+            with Pool(n_jobs) as pool:
+                batched_results = pool.map(self.run_inference, solvers)
 
         # Make result of Pool computation into flat list of probabilities
         flattened_data = []
@@ -109,9 +130,6 @@ class ProMis:
         else:
             raise ValueError(f"Unsupported interpolation method {method} chosen for ProMis.solve!")
 
-        # Restore prior target of StaRMap            
-        self.star_map.target = target
-
         return inference_results
 
     @staticmethod
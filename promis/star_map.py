@@ -145,18 +145,21 @@ class StaRMap:
             else:
                 raise f"Unsupported method {self.method} in StaRMap!"
 
-    def get(self, relation: str, location_type: str) -> Distance | Over:
+    def get(
+        self, relation: str, location_type: str, target: CartesianCollection | None = None
+    ) -> Distance | Over:
         """Get the computed data for a relation to a location type.
 
         Args:
             relation: The relation to return, currently 'over' and 'distance' are supported
             location_type: The location type to relate to
+            target: The points to compute the relation for, defaults to the StaR Map's target
 
         Returns:
             The Collection of computed points for this relation
         """
 
-        parameters = deepcopy(self.target)
+        parameters = deepcopy(self.target if target is None else target)
         coordinates = parameters.coordinates()
 
         if self.method == "gaussian_process":
@@ -185,7 +188,8 @@ class StaRMap:
             for relation, location_type in product(relations, location_types)
         ]
 
-    def get_mentioned_relations(self, logic: str) -> list[tuple[str, str]]:
+    @staticmethod
+    def get_mentioned_relations(logic: str) -> list[tuple[str, str]]:
         """Get all relations mentioned in a logic program.
 
         Args:
@@ -210,11 +214,14 @@ class StaRMap:
 
         return mentioned_relations
 
-    def get_from_logic(self, logic: str) -> list[Relation]:
+    def get_from_logic(
+        self, logic: str, target: CartesianCollection | None = None
+    ) -> list[Relation]:
         """Get all relations mentioned in a logic program.
 
         Args:
             logic: The logic program
+            target: The points to compute the relations for, defaults to the StaR Map's target
 
         Returns:
             A list of the Relations mentioned in the program
@@ -222,7 +229,7 @@ class StaRMap:
 
         relations = []
         for relation_type, location_type in self.get_mentioned_relations(logic):
-            relations.append(self.get(relation_type, location_type))
+            relations.append(self.get(relation_type, location_type, target))
 
         return relations
 